@@ -3,56 +3,235 @@
  * Handles automatic payments and reward distribution
  */
 
+const crypto = require('crypto');
 const { ethers } = require('ethers');
+const logger = require('./logger');
+const { getProvider } = require('./provider');
+const { toWei } = require('./amounts');
+const { GIANKY_TOKEN_ADDRESS, GIANKY_NFT_ADDRESS, TOKEN_ABI, NFT_ABI } = require('./contracts');
 require('dotenv').config();
 
+// Gas price moves once per block (~2s on Polygon), so fee data is reused for that long
+const FEE_DATA_TTL_MS = 2000;
+
+// Admin NFT holdings only change when an NFT is sent, which clears this cache early
+const NFT_BALANCE_TTL_MS = 60000;
+
+// Upper bound on waiting for a transaction to be mined, so a stuck
+// transaction fails its request instead of holding it open indefinitely
+const RECEIPT_TIMEOUT_MS = Number(process.env.RECEIPT_TIMEOUT_MS || 120000);
+
+// totalSupply only grows and is shown for diagnostics, so a slightly stale value is fine
+const TOTAL_SUPPLY_TTL_MS = 15000;
+
+// Game fee in wei: 5 Gianky (for testing, 50 for production)
+const GAME_FEE_WEI = ethers.parseEther('5');
+
+// Parsed interfaces, so each contract reuses the same fragments instead of re-parsing the ABI
+const TOKEN_INTERFACE = new ethers.Interface(TOKEN_ABI);
+const NFT_INTERFACE = new ethers.Interface(NFT_ABI);
+
+// Resolved once for the ownerOf encoding loop in getTokenOwners()
+const OWNER_OF = NFT_INTERFACE.getFunction('ownerOf');
+
+// Multicall3 is deployed at this address on Polygon and most other EVM chains
+const MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11';
+const MULTICALL3_INTERFACE = new ethers.Interface([
+  'function aggregate3((address target, bool allowFailure, bytes callData)[] calls) payable returns ((bool success, bytes returnData)[] returnData)'
+]);
+
+// ownerOf lookups per aggregate3 call, kept well below the node's eth_call gas cap
+const MULTICALL_CHUNK_SIZE = 500;
+
+// Per NFT type: token ID prefix and the Gianky paid when no NFT can be sent
+const NFT_REWARDS = new Map([
+  ['🎯 Starter NFT', Object.freeze({ tokenIdBase: 1, giankyEquivalent: 10 })],
+  ['⭐ Basic NFT', Object.freeze({ tokenIdBase: 2, giankyEquivalent: 15 })],
+  ['🏅 Standard NFT', Object.freeze({ tokenIdBase: 3, giankyEquivalent: 25 })],
+  ['👑 VIP NFT', Object.freeze({ tokenIdBase: 4, giankyEquivalent: 50 })],
+  ['💎 Premium NFT', Object.freeze({ tokenIdBase: 5, giankyEquivalent: 75 })],
+  ['💍 Diamond NFT', Object.freeze({ tokenIdBase: 6, giankyEquivalent: 100 })]
+]);
+
+// Ultra-safe MATIC amounts based on current balance (~15.9 MATIC)
+// Extremely small amounts to ensure they always work
+const SAFE_MATIC_AMOUNTS = Object.freeze([0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.4, 0.5]);
+const SAFE_MATIC_WEI = new Map(SAFE_MATIC_AMOUNTS.map(amount => [amount, toWei(amount)]));
+
+// Number inside a reward string such as "🪙 0.5 Polygon"
+const REWARD_AMOUNT_PATTERN = /[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?/i;
+
+/**
+ * Read the numeric amount from a reward value (a number or a reward string)
+ */
+function parseRewardAmount(amount) {
+  if (typeof amount === 'number') {
+    return amount;
+  }
+  const match = REWARD_AMOUNT_PATTERN.exec(String(amount));
+  return match ? parseFloat(match[0]) : NaN;
+}
+
+/**
+ * Build a unique placeholder hash for a reward that was not sent on-chain
+ */
+function mockTxHash(kind) {
+  return `mock_${kind}_${crypto.randomBytes(8).toString('hex')}`;
+}
+
+/**
+ * Nonce manager that reloads the nonce from the chain when a read or send fails
+ *
+ * Nonces are counted locally so concurrent rewards never reuse one; a
+ * rejected transaction would otherwise leave a gap that stalls every later one,
+ * and a failed first read would otherwise stay cached until restart.
+ */
+class ResyncingNonceManager extends ethers.NonceManager {
+  async getNonce(blockTag) {
+    try {
+      return await super.getNonce(blockTag);
+    } catch (error) {
+      this.reset();
+      throw error;
+    }
+  }
+
+  /**
+   * Send with the next local nonce
+   *
+   * Same as NonceManager.sendTransaction, except the nonce is set before the
+   * wallet populates the transaction, so the wallet does not fetch one from
+   * the chain just for NonceManager to overwrite it.
+   */
+  async sendTransaction(tx) {
+    try {
+      const noncePromise = this.getNonce('pending');
+      this.increment();
+      const populated = await this.signer.populateTransaction({ ...tx, nonce: await noncePromise });
+      return await this.signer.sendTransaction(populated);
+    } catch (error) {
+      this.reset();
+      throw error;
+    }
+  }
+}
+
 class AdminWalletService {
   constructor() {
     // Admin wallet configuration
     this.adminPrivateKey = process.env.ADMIN_PRIVATE_KEY;
     this.adminAddress = process.env.ADMIN_ADDRESS;
     
+    // Checksummed once, in the same form ethers decodes ownerOf results, so
+    // token scans compare owners with a plain string check
+    const adminAddressLower = String(this.adminAddress).toLowerCase();
+    this.adminOwnerAddress = ethers.isAddress(adminAddressLower) ? ethers.getAddress(adminAddressLower) : null;
+    
     // Contract addresses
-    this.tokenContract = '0x370806781689e670f85311700445449ac7c3ff7a';
-    this.nftContract = '0xdc91E2fD661E88a9a1bcB1c826B5579232fc9898';
+    this.tokenContract = GIANKY_TOKEN_ADDRESS;
+    this.nftContract = GIANKY_NFT_ADDRESS;
     
-    // Polygon RPC with network detection
-    this.provider = new ethers.JsonRpcProvider(process.env.POLYGON_RPC_URL);
+    // Shared Polygon RPC provider with a fixed network
+    this.provider = getProvider();
     
-    // Test network connection
-    this.provider.getNetwork().then(network => {
-      console.log(`✅ Connected to network: ${network.name} (Chain ID: ${network.chainId})`);
+    // Test network connection once, since the provider no longer re-checks the chain id
+    Promise.all([this.provider.getNetwork(), this.provider.send('eth_chainId', [])]).then(([network, chainId]) => {
+      if (BigInt(chainId) !== network.chainId) {
+        logger.error('❌ RPC chain ID %s does not match POLYGON_CHAIN_ID %s', BigInt(chainId).toString(), network.chainId.toString());
+        return;
+      }
+      logger.info('✅ Connected to network: %s (Chain ID: %s)', network.name, network.chainId.toString());
     }).catch(error => {
-      console.error('❌ Network detection failed:', error.message);
+      logger.error('❌ Network detection failed:', error.message);
     });
     
-    this.adminWallet = new ethers.Wallet(this.adminPrivateKey, this.provider);
+    // Every admin transaction goes through one nonce manager, so only the
+    // first send reads the nonce from the chain
+    this.adminWallet = new ResyncingNonceManager(new ethers.Wallet(this.adminPrivateKey, this.provider));
+    
+    this.tokenContract = new ethers.Contract(this.tokenContract, TOKEN_INTERFACE, this.adminWallet);
+    this.nftContract = new ethers.Contract(this.nftContract, NFT_INTERFACE, this.adminWallet);
+    this.multicall = new ethers.Contract(MULTICALL3_ADDRESS, MULTICALL3_INTERFACE, this.provider);
     
-    // Contract ABIs
-    this.tokenABI = [
-      'function transfer(address to, uint256 amount) returns (bool)',
-      'function balanceOf(address account) view returns (uint256)',
-      'function approve(address spender, uint256 amount) returns (bool)',
-      'function transferFrom(address from, address to, uint256 amount) returns (bool)'
-    ];
+    // Short-lived fee data cache shared by all reward transfers
+    this.feeDataPromise = null;
+    this.feeDataFetchedAt = 0;
     
-    this.nftABI = [
-      'function mint(address to, uint256 tokenId)',
-      'function safeMint(address to, uint256 tokenId)',
-      'function mintTo(address to, uint256 tokenId)',
-      'function mintNFT(address to, uint256 tokenId)',
-      'function createToken(address to, uint256 tokenId)',
-      'function balanceOf(address owner) view returns (uint256)',
-      'function ownerOf(uint256 tokenId) view returns (address)',
-      'function tokenURI(uint256 tokenId) view returns (string)',
-      'function totalSupply() view returns (uint256)',
-      'function tokenByIndex(uint256 index) view returns (uint256)',
-      'function tokenOfOwnerByIndex(address owner, uint256 index) view returns (uint256)',
-      'function transferFrom(address from, address to, uint256 tokenId)'
-    ];
+    // Cached result of getAdminNFTBalance()
+    this.nftBalanceCache = null;
+    this.nftBalanceFetchedAt = 0;
     
-    this.tokenContract = new ethers.Contract(this.tokenContract, this.tokenABI, this.adminWallet);
-    this.nftContract = new ethers.Contract(this.nftContract, this.nftABI, this.adminWallet);
+    // Short-lived NFT totalSupply cache for the debug endpoints
+    this.totalSupplyPromise = null;
+    this.totalSupplyFetchedAt = 0;
+    
+    // Detected NFT standard; the contract address is fixed, so it never changes
+    this.contractType = null;
+  }
+
+  /**
+   * Get current fee data, reusing a recent result for FEE_DATA_TTL_MS
+   */
+  getFeeData() {
+    const now = Date.now();
+    if (!this.feeDataPromise || now - this.feeDataFetchedAt > FEE_DATA_TTL_MS) {
+      this.feeDataFetchedAt = now;
+      this.feeDataPromise = this.provider.getFeeData().catch(error => {
+        // Do not keep a failed lookup around for the next caller
+        this.feeDataPromise = null;
+        throw error;
+      });
+    }
+    return this.feeDataPromise;
+  }
+
+  /**
+   * Get the NFT contract totalSupply, reusing a recent result for TOTAL_SUPPLY_TTL_MS
+   */
+  getTotalSupply() {
+    const now = Date.now();
+    if (!this.totalSupplyPromise || now - this.totalSupplyFetchedAt > TOTAL_SUPPLY_TTL_MS) {
+      this.totalSupplyFetchedAt = now;
+      this.totalSupplyPromise = this.nftContract.totalSupply().catch(error => {
+        this.totalSupplyPromise = null;
+        throw error;
+      });
+    }
+    return this.totalSupplyPromise;
+  }
+
+  /**
+   * Get fee overrides for the next admin transaction
+   *
+   * Passing these to a contract call stops ethers from looking up fee data
+   * again before signing; the nonce comes from the nonce manager.
+   */
+  async getTxOverrides() {
+    const feeData = await this.getFeeData();
+    
+    const overrides = {};
+    if (feeData.maxFeePerGas != null) {
+      overrides.maxFeePerGas = feeData.maxFeePerGas;
+      overrides.maxPriorityFeePerGas = feeData.maxPriorityFeePerGas;
+    } else {
+      overrides.gasPrice = feeData.gasPrice;
+    }
+    
+    return overrides;
+  }
+
+  /**
+   * Read the admin token balance with the overrides for the transfer that follows
+   *
+   * The balance and fee reads go out as one JSON-RPC batch.
+   */
+  async getTokenTransferContext() {
+    const [balance, overrides] = await Promise.all([
+      this.tokenContract.balanceOf(this.adminAddress),
+      this.getTxOverrides()
+    ]);
+    
+    return { balance, overrides };
   }
 
   /**
@@ -60,11 +239,11 @@ class AdminWalletService {
    */
   async processGamePayment(userAddress, rewardType, rewardAmount = 0, rewardString = '') {
     try {
-      console.log(`Processing payment for user: ${userAddress}`);
+      logger.info('Processing payment for user: %s', userAddress);
       
       // Step 1: Check admin wallet balance
       const adminBalance = await this.tokenContract.balanceOf(this.adminAddress);
-      const requiredAmount = ethers.parseEther('5'); // 5 Gianky fee (for testing, 50 for production)
+      const requiredAmount = GAME_FEE_WEI;
       
       if (adminBalance < requiredAmount) {
         throw new Error('Admin wallet insufficient balance');
@@ -73,17 +252,17 @@ class AdminWalletService {
       // Step 2: Process reward FIRST (before paying game fee)
       let rewardTx;
       if (rewardType === 'NFT') {
-        console.log('Minting NFT reward...');
-        console.log('Reward string:', rewardString);
+        logger.debug('Minting NFT reward...');
+        logger.debug('Reward string:', rewardString);
         
         // TEMPORARY WORKAROUND: Admin wallet has NFTs but no minting permissions
-        console.log('⚠️  Admin wallet has NFTs but no minting permissions');
-        console.log('🎁 Returning success for NFT reward without actual minting');
-        console.log('💡 To enable real NFT minting, contact the contract owner');
+        logger.warn('⚠️  Admin wallet has NFTs but no minting permissions');
+        logger.debug('🎁 Returning success for NFT reward without actual minting');
+        logger.debug('💡 To enable real NFT minting, contact the contract owner');
         
         // Create a mock successful transaction
         rewardTx = {
-          hash: `mock_nft_${Date.now()}`,
+          hash: mockTxHash('nft'),
           wait: async () => ({ status: 1 }) // Mock successful receipt
         };
         
@@ -180,14 +359,14 @@ class AdminWalletService {
         */
         
       } else if (rewardType === 'Gianky') {
-        console.log('Transferring Gianky tokens...');
-        const rewardAmountWei = ethers.parseEther(rewardAmount.toString());
+        logger.debug('Transferring Gianky tokens...');
+        const rewardAmountWei = toWei(rewardAmount);
         
         // Check if we have enough Gianky tokens
         const adminGiankyBalance = await this.tokenContract.balanceOf(this.adminAddress);
-        console.log('Gianky Transfer Details:');
-        console.log('  Admin Gianky Balance:', ethers.formatEther(adminGiankyBalance));
-        console.log('  Reward Amount:', rewardAmount, 'GIANKY');
+        logger.debug('Gianky Transfer Details:');
+        logger.debug('  Admin Gianky Balance:', ethers.formatEther(adminGiankyBalance));
+        logger.debug('  Reward Amount:', rewardAmount, 'GIANKY');
         
         if (adminGiankyBalance < rewardAmountWei) {
           throw new Error(`Insufficient Gianky tokens. Need ${ethers.formatEther(rewardAmountWei)} but have ${ethers.formatEther(adminGiankyBalance)}`);
@@ -197,23 +376,25 @@ class AdminWalletService {
           gasLimit: 65000 // Optimized gas for ERC20 transfer
         });
       } else if (rewardType === 'Polygon') {
-        console.log('Transferring Polygon tokens...');
-        // For MATIC, we need to send native tokens with optimized gas
-        const gasPrice = await this.provider.getFeeData();
+        logger.debug('Transferring Polygon tokens...');
+        // Fee data and balance are requested together so the provider
+        // sends them as a single JSON-RPC batch
+        const [gasPrice, adminMaticBalance] = await Promise.all([
+          this.getFeeData(),
+          this.provider.getBalance(this.adminAddress)
+        ]);
         
         // Use minimum gas limit for simple transfers
         const gasLimit = 21000; // Minimum gas for simple transfer
         
-        // Check if we have enough MATIC for the transaction
-        const adminMaticBalance = await this.provider.getBalance(this.adminAddress);
-        const requiredAmount = ethers.parseEther(rewardAmount.toString());
-        const estimatedGasCost = gasLimit * (gasPrice.maxFeePerGas || gasPrice.gasPrice);
+        const requiredAmount = toWei(rewardAmount);
+        const estimatedGasCost = BigInt(gasLimit) * (gasPrice.maxFeePerGas || gasPrice.gasPrice);
         
-        console.log('MATIC Transfer Details:');
-        console.log('  Admin MATIC Balance:', ethers.formatEther(adminMaticBalance));
-        console.log('  Reward Amount:', rewardAmount, 'MATIC');
-        console.log('  Gas Limit:', gasLimit);
-        console.log('  Estimated Gas Cost:', ethers.formatEther(estimatedGasCost), 'MATIC');
+        logger.debug('MATIC Transfer Details:');
+        logger.debug('  Admin MATIC Balance:', ethers.formatEther(adminMaticBalance));
+        logger.debug('  Reward Amount:', rewardAmount, 'MATIC');
+        logger.debug('  Gas Limit:', gasLimit);
+        logger.debug('  Estimated Gas Cost:', ethers.formatEther(estimatedGasCost), 'MATIC');
         
         if (adminMaticBalance < (requiredAmount + estimatedGasCost)) {
           throw new Error(`Insufficient MATIC. Need ${ethers.formatEther(requiredAmount + estimatedGasCost)} but have ${ethers.formatEther(adminMaticBalance)}`);
@@ -229,15 +410,15 @@ class AdminWalletService {
       }
       
       if (rewardTx) {
-        await rewardTx.wait();
+        await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
       }
       
       // Step 3: Pay game fee ONLY after reward is successfully processed
-      console.log('Paying game fee...');
+      logger.debug('Paying game fee...');
       const feeTx = await this.tokenContract.transfer(this.nftContract, requiredAmount, {
         gasLimit: 50000 // Optimized gas for game fee transfer
       });
-      await feeTx.wait();
+      await feeTx.wait(1, RECEIPT_TIMEOUT_MS);
       
       return {
         success: true,
@@ -247,7 +428,7 @@ class AdminWalletService {
       };
       
     } catch (error) {
-      console.error('Error processing payment:', error);
+      logger.error('Error processing payment:', error);
       
       // If reward processing failed, don't charge the user
       if (error.message.includes('NFT minting failed') || 
@@ -261,7 +442,9 @@ class AdminWalletService {
       
       return {
         success: false,
-        error: error.message
+        error: error.message,
+        // A receipt timeout leaves the transaction's outcome unknown
+        pending: error.code === 'TIMEOUT'
       };
     }
   }
@@ -271,22 +454,23 @@ class AdminWalletService {
    */
   async processGameFee(userAddress) {
     try {
-      console.log(`Processing game fee for user: ${userAddress}`);
+      logger.info('Processing game fee for user: %s', userAddress);
       
       // Check admin wallet balance
-      const adminBalance = await this.tokenContract.balanceOf(this.adminAddress);
-      const requiredAmount = ethers.parseEther('5'); // 5 Gianky fee
+      const { balance: adminBalance, overrides } = await this.getTokenTransferContext();
+      const requiredAmount = GAME_FEE_WEI;
       
       if (adminBalance < requiredAmount) {
         throw new Error('Admin wallet insufficient balance');
       }
       
       // Pay game fee
-      console.log('Paying game fee...');
+      logger.debug('Paying game fee...');
       const feeTx = await this.tokenContract.transfer(this.nftContract, requiredAmount, {
+        ...overrides,
         gasLimit: 50000 // Optimized gas for game fee transfer
       });
-      await feeTx.wait();
+      await feeTx.wait(1, RECEIPT_TIMEOUT_MS);
       
       return {
         success: true,
@@ -295,10 +479,12 @@ class AdminWalletService {
       };
       
     } catch (error) {
-      console.error('Error processing game fee:', error);
+      logger.error('Error processing game fee:', error);
       return {
         success: false,
-        error: error.message
+        error: error.message,
+        // A receipt timeout leaves the transaction's outcome unknown
+        pending: error.code === 'TIMEOUT'
       };
     }
   }
@@ -308,15 +494,15 @@ class AdminWalletService {
    */
   async processGiankyReward(userAddress, amount) {
     try {
-      console.log(`Processing Gianky reward: ${amount} GIANKY for ${userAddress}`);
+      logger.info('Processing Gianky reward: %s GIANKY for %s', amount, userAddress);
       
       // Check if we have enough Gianky tokens
-      const adminGiankyBalance = await this.tokenContract.balanceOf(this.adminAddress);
-      const rewardAmountWei = ethers.parseEther(amount.toString());
+      const { balance: adminGiankyBalance, overrides } = await this.getTokenTransferContext();
+      const rewardAmountWei = toWei(amount);
       
-      console.log('Gianky Transfer Details:');
-      console.log('  Admin Gianky Balance:', ethers.formatEther(adminGiankyBalance));
-      console.log('  Reward Amount:', amount, 'GIANKY');
+      logger.debug('Gianky Transfer Details:');
+      logger.debug('  Admin Gianky Balance:', ethers.formatEther(adminGiankyBalance));
+      logger.debug('  Reward Amount:', amount, 'GIANKY');
       
       if (adminGiankyBalance < rewardAmountWei) {
         throw new Error(`Insufficient Gianky tokens. Need ${ethers.formatEther(rewardAmountWei)} but have ${ethers.formatEther(adminGiankyBalance)}`);
@@ -324,9 +510,10 @@ class AdminWalletService {
       
       // Transfer Gianky tokens
       const rewardTx = await this.tokenContract.transfer(userAddress, rewardAmountWei, {
+        ...overrides,
         gasLimit: 65000 // Optimized gas for ERC20 transfer
       });
-      await rewardTx.wait();
+      await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
       
       return {
         success: true,
@@ -335,10 +522,12 @@ class AdminWalletService {
       };
       
     } catch (error) {
-      console.error('Error processing Gianky reward:', error);
+      logger.error('Error processing Gianky reward:', error);
       return {
         success: false,
-        error: error.message
+        error: error.message,
+        // A receipt timeout leaves the transaction's outcome unknown
+        pending: error.code === 'TIMEOUT'
       };
     }
   }
@@ -348,39 +537,41 @@ class AdminWalletService {
    */
   async processMaticReward(userAddress, amount) {
     try {
-      console.log(`Processing MATIC reward: ${amount} MATIC for ${userAddress}`);
+      logger.info('Processing MATIC reward: %s MATIC for %s', amount, userAddress);
       
       // Reduce MATIC amount to safe range (1-5 MATIC)
       const safeAmount = this.getSafeMaticAmount(amount);
       
       if (safeAmount !== amount) {
-        console.log(`⚠️  MATIC amount reduced from ${amount} to ${safeAmount} for safety`);
+        logger.warn('⚠️  MATIC amount reduced from %s to %s for safety', amount, safeAmount);
       }
       
-      // For MATIC, we need to send native tokens with optimized gas
-      const gasPrice = await this.provider.getFeeData();
+      // Fee data and balance are requested together so the provider
+      // sends them as a single JSON-RPC batch
+      const [gasPrice, adminMaticBalance] = await Promise.all([
+        this.getFeeData(),
+        this.provider.getBalance(this.adminAddress)
+      ]);
       
       // Use minimum gas limit for simple transfers
       const gasLimit = 21000; // Minimum gas for simple transfer
       
-      // Check if we have enough MATIC for the transaction
-      const adminMaticBalance = await this.provider.getBalance(this.adminAddress);
-      const requiredAmount = ethers.parseEther(safeAmount.toString());
+      const requiredAmount = SAFE_MATIC_WEI.get(safeAmount);
       
       // Fix BigInt conversion issue
       const gasPriceValue = gasPrice.maxFeePerGas || gasPrice.gasPrice;
       const estimatedGasCost = BigInt(gasLimit) * BigInt(gasPriceValue);
       
-      console.log('MATIC Transfer Details:');
-      console.log('  Admin MATIC Balance:', ethers.formatEther(adminMaticBalance));
-      console.log('  Original Amount:', amount, 'MATIC');
-      console.log('  Safe Amount:', safeAmount, 'MATIC');
-      console.log('  Gas Limit:', gasLimit);
-      console.log('  Gas Price:', gasPriceValue.toString());
-      console.log('  Estimated Gas Cost:', ethers.formatEther(estimatedGasCost), 'MATIC');
+      logger.debug('MATIC Transfer Details:');
+      logger.debug('  Admin MATIC Balance:', ethers.formatEther(adminMaticBalance));
+      logger.debug('  Original Amount:', amount, 'MATIC');
+      logger.debug('  Safe Amount:', safeAmount, 'MATIC');
+      logger.debug('  Gas Limit:', gasLimit);
+      logger.debug('  Gas Price:', gasPriceValue.toString());
+      logger.debug('  Estimated Gas Cost:', ethers.formatEther(estimatedGasCost), 'MATIC');
       
       if (adminMaticBalance < (requiredAmount + estimatedGasCost)) {
-        console.log('❌ Insufficient MATIC, falling back to Gianky tokens...');
+        logger.warn('❌ Insufficient MATIC, falling back to Gianky tokens...');
         return await this.processMaticToGiankyFallback(userAddress, amount);
       }
       
@@ -392,7 +583,7 @@ class AdminWalletService {
         maxFeePerGas: gasPrice.maxFeePerGas,
         maxPriorityFeePerGas: gasPrice.maxPriorityFeePerGas
       });
-      await rewardTx.wait();
+      await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
       
       return {
         success: true,
@@ -401,10 +592,20 @@ class AdminWalletService {
       };
       
     } catch (error) {
-      console.error('Error processing MATIC reward:', error);
+      logger.error('Error processing MATIC reward:', error);
+      
+      // The MATIC transfer may still be mined after a receipt timeout, so
+      // sending the Gianky fallback as well could pay the user twice
+      if (error.code === 'TIMEOUT') {
+        return {
+          success: false,
+          error: error.message,
+          pending: true
+        };
+      }
       
       // Fallback to Gianky tokens if MATIC transfer fails
-      console.log('🔄 MATIC transfer failed, falling back to Gianky tokens...');
+      logger.warn('🔄 MATIC transfer failed, falling back to Gianky tokens...');
       return await this.processMaticToGiankyFallback(userAddress, amount);
     }
   }
@@ -413,18 +614,12 @@ class AdminWalletService {
    * Get safe MATIC amount within 0.05-0.5 MATIC range
    */
   getSafeMaticAmount(originalAmount) {
-    // Parse the amount (remove "🪙 " prefix if present)
-    const cleanAmount = originalAmount.toString().replace('🪙 ', '').replace(' Polygon', '');
-    const numericAmount = parseFloat(cleanAmount);
-    
-    // Ultra-safe MATIC amounts based on current balance (~15.9 MATIC)
-    // Extremely small amounts to ensure they always work
-    const safeAmounts = [0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.4, 0.5];
+    const numericAmount = parseRewardAmount(originalAmount);
     
     // Find the closest safe amount
     let safeAmount = 0.05; // Default minimum (ultra small)
     
-    for (const amount of safeAmounts) {
+    for (const amount of SAFE_MATIC_AMOUNTS) {
       if (numericAmount >= amount) {
         safeAmount = amount;
       } else {
@@ -440,28 +635,29 @@ class AdminWalletService {
    */
   async processMaticToGiankyFallback(userAddress, originalMaticAmount) {
     try {
-      console.log('💰 Converting MATIC reward to Gianky tokens...');
+      logger.debug('💰 Converting MATIC reward to Gianky tokens...');
       
       // Convert MATIC amount to Gianky equivalent (1 MATIC = 2 Gianky)
       const giankyEquivalent = this.getMaticToGiankyEquivalent(originalMaticAmount);
       
       // Check if we have enough Gianky tokens
-      const adminGiankyBalance = await this.tokenContract.balanceOf(this.adminAddress);
+      const { balance: adminGiankyBalance, overrides } = await this.getTokenTransferContext();
       const rewardAmountWei = ethers.parseEther(giankyEquivalent.toString());
       
-      console.log('MATIC to Gianky Conversion:');
-      console.log(`  Original MATIC: ${originalMaticAmount}`);
-      console.log(`  Gianky Equivalent: ${giankyEquivalent} GIANKY`);
-      console.log(`  Admin Gianky Balance: ${ethers.formatEther(adminGiankyBalance)}`);
+      logger.debug('MATIC to Gianky Conversion:');
+      logger.debug('  Original MATIC: %s', originalMaticAmount);
+      logger.debug('  Gianky Equivalent: %s GIANKY', giankyEquivalent);
+      logger.debug('  Admin Gianky Balance: %s', ethers.formatEther(adminGiankyBalance));
       
       if (adminGiankyBalance >= rewardAmountWei) {
         // Transfer Gianky tokens
         const rewardTx = await this.tokenContract.transfer(userAddress, rewardAmountWei, {
+          ...overrides,
           gasLimit: 65000
         });
         
-        await rewardTx.wait();
-        console.log('✅ Gianky tokens sent as MATIC alternative!');
+        await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
+        logger.debug('✅ Gianky tokens sent as MATIC alternative!');
         
         return {
           success: true,
@@ -470,11 +666,11 @@ class AdminWalletService {
         };
         
       } else {
-        console.log('❌ Insufficient Gianky tokens for fallback');
+        logger.warn('❌ Insufficient Gianky tokens for fallback');
         
         // Final fallback: Mock success
         const rewardTx = {
-          hash: `mock_matic_fallback_${Date.now()}`,
+          hash: mockTxHash('matic_fallback'),
           wait: async () => ({ status: 1 })
         };
         
@@ -486,11 +682,21 @@ class AdminWalletService {
       }
       
     } catch (error) {
-      console.error('❌ Error processing MATIC to Gianky fallback:', error);
+      logger.error('❌ Error processing MATIC to Gianky fallback:', error);
+      
+      // The Gianky transfer may still be mined after a receipt timeout, so
+      // report the outcome as unknown rather than a mock success
+      if (error.code === 'TIMEOUT') {
+        return {
+          success: false,
+          error: error.message,
+          pending: true
+        };
+      }
       
       // Ultimate fallback
       const rewardTx = {
-        hash: `mock_matic_ultimate_${Date.now()}`,
+        hash: mockTxHash('matic_ultimate'),
         wait: async () => ({ status: 1 })
       };
       
@@ -506,9 +712,7 @@ class AdminWalletService {
    * Convert MATIC amount to Gianky equivalent
    */
   getMaticToGiankyEquivalent(maticAmount) {
-    // Parse the amount (remove "🪙 " prefix if present)
-    const cleanAmount = maticAmount.toString().replace('🪙 ', '').replace(' Polygon', '');
-    const numericAmount = parseFloat(cleanAmount);
+    const numericAmount = parseRewardAmount(maticAmount);
     
     // Conversion rate: 1 MATIC = 2 Gianky
     const giankyEquivalent = Math.floor(numericAmount * 2);
@@ -522,21 +726,25 @@ class AdminWalletService {
    */
   async processNFTReward(userAddress, nftType) {
     try {
-      console.log(`Processing NFT reward: ${nftType} for ${userAddress}`);
+      logger.info('Processing NFT reward: %s for %s', nftType, userAddress);
       
-      // Check admin wallet NFT balance
-      const adminNFTBalance = await this.nftContract.balanceOf(this.adminAddress);
-      console.log('Admin wallet NFT balance:', adminNFTBalance.toString());
+      // A recent balance check that found no NFTs answers without any RPC
+      const cachedBalance = this.nftBalanceCache &&
+        Date.now() - this.nftBalanceFetchedAt < NFT_BALANCE_TTL_MS ? this.nftBalanceCache : null;
       
       // Smart NFT Transfer Strategy
-      if (adminNFTBalance > 0) { // Changed from > 5 to > 0 to allow transfers
-        console.log('🎁 Attempting to transfer existing NFT to user...');
+      if (!cachedBalance || cachedBalance.total > 0) {
+        logger.debug('🎁 Attempting to transfer existing NFT to user...');
         
-        // Find available token ID using smart search
-        const availableTokenId = await this.findAvailableTokenId();
+        // The token search only finds IDs the admin holds, so it doubles as
+        // the balance check; the transfer's fee data shares its batch
+        const [availableTokenId, overrides] = await Promise.all([
+          this.findAvailableTokenId(),
+          this.getTxOverrides()
+        ]);
         
         if (availableTokenId) {
-          console.log(`✅ Found available token ID: ${availableTokenId}`);
+          logger.debug('✅ Found available token ID: %s', availableTokenId);
           
           try {
             // Transfer NFT to user with proper error handling
@@ -544,13 +752,16 @@ class AdminWalletService {
               this.adminAddress, 
               userAddress, 
               availableTokenId,
-              { gasLimit: 100000 }
+              { ...overrides, gasLimit: 100000 }
             );
             
-            console.log(`📝 Transfer transaction hash: ${rewardTx.hash}`);
-              await rewardTx.wait();
+            // The admin wallet no longer holds this token
+            this.nftBalanceCache = null;
+            
+            logger.debug('📝 Transfer transaction hash: %s', rewardTx.hash);
+              await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
               
-            console.log('✅ NFT transferred successfully!');
+            logger.debug('✅ NFT transferred successfully!');
             
           return {
             success: true,
@@ -559,57 +770,98 @@ class AdminWalletService {
           };
             
           } catch (transferError) {
-            console.error('❌ NFT transfer failed:', transferError.message);
-            console.log('🔄 Falling back to hybrid reward system...');
+            logger.error('❌ NFT transfer failed:', transferError.message);
+            
+            // The NFT transfer may still be mined after a receipt timeout, so
+            // sending the Gianky fallback as well could pay the user twice
+            if (transferError.code === 'TIMEOUT') {
+              return {
+                success: false,
+                error: transferError.message,
+                pending: true
+              };
+            }
+            
+            logger.warn('🔄 Falling back to hybrid reward system...');
             
             // Fallback: Give Gianky tokens instead
             return await this.processHybridReward(userAddress, nftType);
           }
         } else {
-          console.log('❌ No available token IDs found');
+          logger.warn('❌ No available token IDs found');
           return await this.processHybridReward(userAddress, nftType);
         }
         
       } else {
         // No NFTs available - use hybrid reward system
-        console.log('⚠️  No NFTs available, using hybrid reward system');
+        logger.warn('⚠️  No NFTs available, using hybrid reward system');
         return await this.processHybridReward(userAddress, nftType);
       }
       
     } catch (error) {
-      console.error('❌ Error processing NFT reward:', error);
+      logger.error('❌ Error processing NFT reward:', error);
       
       // Ultimate fallback: Give Gianky tokens
-      console.log('🔄 Ultimate fallback: Processing Gianky token reward');
+      logger.warn('🔄 Ultimate fallback: Processing Gianky token reward');
       return await this.processHybridReward(userAddress, nftType);
     }
   }
 
+  /**
+   * Look up the owners of many NFTs with Multicall3
+   *
+   * Returns one address per token ID, or null where ownerOf reverted
+   * (e.g. the token was never minted).
+   */
+  async getTokenOwners(tokenIds) {
+    const owners = [];
+    
+    for (let i = 0; i < tokenIds.length; i += MULTICALL_CHUNK_SIZE) {
+      const chunk = tokenIds.slice(i, i + MULTICALL_CHUNK_SIZE);
+      
+      try {
+        const results = await this.multicall.aggregate3.staticCall(chunk.map(tokenId => ({
+          target: this.nftContract.target,
+          allowFailure: true,
+          callData: NFT_INTERFACE.encodeFunctionData(OWNER_OF, [tokenId])
+        })));
+        
+        for (const { success, returnData } of results) {
+          owners.push(success ? NFT_INTERFACE.decodeFunctionResult(OWNER_OF, returnData)[0] : null);
+        }
+      } catch (error) {
+        // No Multicall3 on this chain: the provider still batches these into one request
+        logger.warn('⚠️  Multicall owner lookup failed, using ownerOf:', error.message);
+        owners.push(...await Promise.all(chunk.map(tokenId => this.nftContract.ownerOf(tokenId).catch(() => null))));
+      }
+    }
+    
+    return owners;
+  }
+
   /**
    * Find available token ID owned by admin wallet
    */
   async findAvailableTokenId() {
-    console.log('🔍 Searching for available token IDs...');
+    logger.debug('🔍 Searching for available token IDs...');
     
     // Use our known working token IDs instead of searching random ranges
     const knownTokenIds = [1000093, 2000050, 2000123, 3000028, 3000030, 3000067, 4000018, 5000024];
     
-    console.log('📋 Checking known token IDs for availability...');
+    logger.debug('📋 Checking known token IDs for availability...');
     
-    for (const tokenId of knownTokenIds) {
-      try {
-        const owner = await this.nftContract.ownerOf(tokenId);
-        if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
-          console.log(`✅ Found available token ID: ${tokenId}`);
-          return tokenId;
-        }
-      } catch (error) {
-        console.log(`⚠️  Error checking token ${tokenId}:`, error.message);
-        continue;
+    const owners = await this.getTokenOwners(knownTokenIds);
+    
+    for (let i = 0; i < knownTokenIds.length; i++) {
+      if (owners[i] === null) {
+        logger.warn('⚠️  Could not read owner of token %s', knownTokenIds[i]);
+      } else if (owners[i] === this.adminOwnerAddress) {
+        logger.debug('✅ Found available token ID: %s', knownTokenIds[i]);
+        return knownTokenIds[i];
       }
     }
     
-    console.log('❌ No available token IDs found in known list');
+    logger.warn('❌ No available token IDs found in known list');
     return null;
   }
 
@@ -618,28 +870,29 @@ class AdminWalletService {
    */
   async processHybridReward(userAddress, nftType) {
     try {
-      console.log('💰 Processing hybrid reward (Gianky tokens)...');
+      logger.debug('💰 Processing hybrid reward (Gianky tokens)...');
       
       // Determine Gianky amount based on NFT type
       const giankyAmount = this.getGiankyEquivalent(nftType);
       
       // Check if we have enough Gianky tokens
-      const adminGiankyBalance = await this.tokenContract.balanceOf(this.adminAddress);
+      const { balance: adminGiankyBalance, overrides } = await this.getTokenTransferContext();
       const rewardAmountWei = ethers.parseEther(giankyAmount.toString());
       
-      console.log('Hybrid Reward Details:');
-      console.log(`  Original NFT: ${nftType}`);
-      console.log(`  Gianky Equivalent: ${giankyAmount} GIANKY`);
-      console.log(`  Admin Gianky Balance: ${ethers.formatEther(adminGiankyBalance)}`);
+      logger.debug('Hybrid Reward Details:');
+      logger.debug('  Original NFT: %s', nftType);
+      logger.debug('  Gianky Equivalent: %s GIANKY', giankyAmount);
+      logger.debug('  Admin Gianky Balance: %s', ethers.formatEther(adminGiankyBalance));
       
       if (adminGiankyBalance >= rewardAmountWei) {
         // Transfer Gianky tokens
         const rewardTx = await this.tokenContract.transfer(userAddress, rewardAmountWei, {
+          ...overrides,
           gasLimit: 65000
         });
         
-        await rewardTx.wait();
-        console.log('✅ Gianky tokens sent successfully!');
+        await rewardTx.wait(1, RECEIPT_TIMEOUT_MS);
+        logger.debug('✅ Gianky tokens sent successfully!');
           
           return {
             success: true,
@@ -648,11 +901,11 @@ class AdminWalletService {
           };
         
       } else {
-        console.log('❌ Insufficient Gianky tokens for hybrid reward');
+        logger.warn('❌ Insufficient Gianky tokens for hybrid reward');
         
         // Final fallback: Mock success but don't charge user
         const rewardTx = {
-          hash: `mock_hybrid_${Date.now()}`,
+          hash: mockTxHash('hybrid'),
           wait: async () => ({ status: 1 })
         };
         
@@ -664,11 +917,21 @@ class AdminWalletService {
       }
       
     } catch (error) {
-      console.error('❌ Error processing hybrid reward:', error);
+      logger.error('❌ Error processing hybrid reward:', error);
+      
+      // The Gianky transfer may still be mined after a receipt timeout, so
+      // report the outcome as unknown rather than a mock success
+      if (error.code === 'TIMEOUT') {
+        return {
+          success: false,
+          error: error.message,
+          pending: true
+        };
+      }
       
       // Ultimate fallback
       const rewardTx = {
-        hash: `mock_ultimate_${Date.now()}`,
+        hash: mockTxHash('ultimate'),
         wait: async () => ({ status: 1 })
       };
       
@@ -684,32 +947,16 @@ class AdminWalletService {
    * Get Gianky token equivalent for NFT types
    */
   getGiankyEquivalent(nftType) {
-    const nftToGiankyMap = {
-      '🎯 Starter NFT': 10,
-      '⭐ Basic NFT': 15,
-      '🏅 Standard NFT': 25,
-      '👑 VIP NFT': 50,
-      '💎 Premium NFT': 75,
-      '💍 Diamond NFT': 100
-    };
-    
-    return nftToGiankyMap[nftType] || 20; // Default 20 Gianky
+    const reward = NFT_REWARDS.get(nftType);
+    return reward ? reward.giankyEquivalent : 20; // Default 20 Gianky
   }
 
   /**
    * Generate unique token ID for NFT
    */
   generateTokenId(nftType) {
-    const typeMap = {
-      '🎯 Starter NFT': 1,
-      '⭐ Basic NFT': 2,
-      '🏅 Standard NFT': 3,
-      '👑 VIP NFT': 4,
-      '💎 Premium NFT': 5,
-      '💍 Diamond NFT': 6
-    };
-    
-    const baseId = typeMap[nftType] || 1;
+    const reward = NFT_REWARDS.get(nftType);
+    const baseId = reward ? reward.tokenIdBase : 1;
     const timestamp = Date.now();
     return baseId * 1000000 + (timestamp % 1000000);
   }
@@ -722,7 +969,7 @@ class AdminWalletService {
       const balance = await this.tokenContract.balanceOf(this.adminAddress);
       return ethers.formatEther(balance);
     } catch (error) {
-      console.error('Error getting admin balance:', error);
+      logger.error('Error getting admin balance:', error);
       return '0';
     }
   }
@@ -735,19 +982,23 @@ class AdminWalletService {
       const balance = await this.provider.getBalance(this.adminAddress);
       return ethers.formatEther(balance);
     } catch (error) {
-      console.error('Error getting admin MATIC balance:', error);
+      logger.error('Error getting admin MATIC balance:', error);
       return '0';
     }
   }
 
   /**
    * Get both Gianky and MATIC balances
+   *
+   * The three lookups run concurrently, so their RPC reads share one batch.
    */
   async getAllBalances() {
     try {
-      const giankyBalance = await this.getAdminBalance();
-      const maticBalance = await this.getAdminMaticBalance();
-      const nftBalance = await this.getAdminNFTBalance();
+      const [giankyBalance, maticBalance, nftBalance] = await Promise.all([
+        this.getAdminBalance(),
+        this.getAdminMaticBalance(),
+        this.getAdminNFTBalance()
+      ]);
       
       return {
         gianky: parseFloat(giankyBalance),
@@ -758,7 +1009,7 @@ class AdminWalletService {
         nftFormatted: nftBalance.toString()
       };
     } catch (error) {
-      console.error('Error getting all balances:', error);
+      logger.error('Error getting all balances:', error);
       return {
         gianky: 0,
         matic: 0,
@@ -774,24 +1025,30 @@ class AdminWalletService {
    * Get admin wallet NFT balance and details
    */
   async getAdminNFTBalance() {
+    if (this.nftBalanceCache && Date.now() - this.nftBalanceFetchedAt < NFT_BALANCE_TTL_MS) {
+      return this.nftBalanceCache;
+    }
+    
     try {
-      console.log('🔍 Checking admin wallet NFT balance...');
-      
-      // Get total NFT balance
-      const totalBalance = await this.nftContract.balanceOf(this.adminAddress);
-      console.log(`📊 Total NFT Balance: ${totalBalance.toString()}`);
+      logger.debug('🔍 Checking admin wallet NFT balance...');
       
-      // Find specific token IDs owned by admin
-      const ownedTokens = await this.findOwnedTokenIds();
+      // Get total NFT balance and find specific token IDs owned by admin
+      const [totalBalance, ownedTokens] = await Promise.all([
+        this.nftContract.balanceOf(this.adminAddress),
+        this.findOwnedTokenIds()
+      ]);
+      logger.debug('📊 Total NFT Balance: %s', totalBalance.toString());
       
-      return {
+      this.nftBalanceCache = {
         total: Number(totalBalance),
         ownedTokens: ownedTokens,
         count: ownedTokens.length
       };
+      this.nftBalanceFetchedAt = Date.now();
+      return this.nftBalanceCache;
       
     } catch (error) {
-      console.error('Error getting admin NFT balance:', error);
+      logger.error('Error getting admin NFT balance:', error);
       return {
         total: 0,
         ownedTokens: [],
@@ -805,37 +1062,36 @@ class AdminWalletService {
    */
   async findOwnedTokenIds() {
     try {
-      console.log('🔍 Direct NFT lookup - using known token IDs...');
-      console.log(`🎯 Admin wallet address: ${this.adminAddress}`);
+      logger.debug('🔍 Direct NFT lookup - using known token IDs...');
+      logger.debug('🎯 Admin wallet address: %s', this.adminAddress);
       
       // You already know these 8 NFTs exist in your admin wallet
       const knownTokenIds = [1000093, 2000050, 2000123, 3000028, 3000030, 3000067, 4000018, 5000024];
       
-      console.log('📋 Checking known token IDs:', knownTokenIds.join(', '));
+      logger.debug('📋 Checking known token IDs:', knownTokenIds.join(', '));
       
       const ownedTokens = [];
-      
-      for (const tokenId of knownTokenIds) {
-        try {
-          const owner = await this.nftContract.ownerOf(tokenId);
-          if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
-            ownedTokens.push(tokenId);
-            console.log(`✅ Confirmed ownership of token ${tokenId}`);
-          } else {
-            console.log(`❌ Token ${tokenId} not owned by admin wallet`);
-          }
-        } catch (error) {
-          console.log(`⚠️  Error checking token ${tokenId}:`, error.message);
+      const owners = await this.getTokenOwners(knownTokenIds);
+      
+      for (let i = 0; i < knownTokenIds.length; i++) {
+        const tokenId = knownTokenIds[i];
+        if (owners[i] === null) {
+          logger.warn('⚠️  Could not read owner of token %s', tokenId);
+        } else if (owners[i] === this.adminOwnerAddress) {
+          ownedTokens.push(tokenId);
+          logger.debug('✅ Confirmed ownership of token %s', tokenId);
+        } else {
+          logger.debug('❌ Token %s not owned by admin wallet', tokenId);
         }
       }
       
-      console.log(`🎉 Total owned tokens confirmed: ${ownedTokens.length}`);
-      console.log(`📋 Token IDs: [${ownedTokens.join(', ')}]`);
+      logger.debug('🎉 Total owned tokens confirmed: %s', ownedTokens.length);
+      logger.debug('📋 Token IDs: [%s]', ownedTokens.join(', '));
       
       return ownedTokens;
       
     } catch (error) {
-      console.error('Error in direct NFT lookup:', error);
+      logger.error('Error in direct NFT lookup:', error);
       return [];
     }
   }
@@ -847,14 +1103,14 @@ class AdminWalletService {
     const foundTokens = [];
     const samplePoints = [100, 200, 300, 400, 500, 1000, 2000, 5000, 10000, 20000, 50000];
     
-    console.log('🔍 Checking sample points:', samplePoints.join(', '));
+    logger.debug('🔍 Checking sample points:', samplePoints.join(', '));
     
     for (const tokenId of samplePoints) {
       try {
         const owner = await this.nftContract.ownerOf(tokenId);
         if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
           foundTokens.push(tokenId);
-          console.log(`✅ Found token ${tokenId} at sample point`);
+          logger.debug('✅ Found token %s at sample point', tokenId);
         }
       } catch (error) {
         // Token doesn't exist, continue
@@ -862,7 +1118,7 @@ class AdminWalletService {
       }
     }
     
-    console.log(`📊 Quick search found ${foundTokens.length} tokens`);
+    logger.debug('📊 Quick search found %s tokens', foundTokens.length);
     return foundTokens;
   }
 
@@ -877,7 +1133,7 @@ class AdminWalletService {
       const start = Math.max(1, tokenId - 50);
       const end = tokenId + 50;
       
-      console.log(`🔍 Searching around token ${tokenId} (${start}-${end})...`);
+      logger.debug('🔍 Searching around token %s (%s-%s)...', tokenId, start, end);
       
       for (let i = start; i <= end; i++) {
         if (foundTokens.includes(i) || additionalTokens.includes(i)) continue;
@@ -886,7 +1142,7 @@ class AdminWalletService {
           const owner = await this.nftContract.ownerOf(i);
           if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
             additionalTokens.push(i);
-            console.log(`✅ Found additional token ${i} near ${tokenId}`);
+            logger.debug('✅ Found additional token %s near %s', i, tokenId);
           }
         } catch (error) {
           continue;
@@ -894,7 +1150,7 @@ class AdminWalletService {
       }
     }
     
-    console.log(`📊 Focused search found ${additionalTokens.length} additional tokens`);
+    logger.debug('📊 Focused search found %s additional tokens', additionalTokens.length);
     return additionalTokens;
   }
 
@@ -913,9 +1169,9 @@ class AdminWalletService {
         { start: 5000000, end: 5100000, step: 100, exact: [5000024] }
       ];
     
-      console.log('🔍 Strategy A: Smart targeted search with exact token checking...');
+      logger.debug('🔍 Strategy A: Smart targeted search with exact token checking...');
       for (const range of smartRanges) {
-        console.log(`🔍 Range ${range.start}-${range.end} (step: ${range.step})...`);
+        logger.debug('🔍 Range %s-%s (step: %s)...', range.start, range.end, range.step);
         
         // First, check exact known token IDs
         for (const exactTokenId of range.exact) {
@@ -923,10 +1179,10 @@ class AdminWalletService {
             const owner = await this.nftContract.ownerOf(exactTokenId);
             if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
               foundTokens.push(exactTokenId);
-              console.log(`✅ Found exact token ${exactTokenId}`);
+              logger.debug('✅ Found exact token %s', exactTokenId);
             }
           } catch (error) {
-            console.log(`⚠️  Error checking exact token ${exactTokenId}:`, error.message);
+            logger.warn('⚠️  Error checking exact token %s:', exactTokenId, error.message);
           }
         }
         
@@ -939,19 +1195,19 @@ class AdminWalletService {
             const owner = await this.nftContract.ownerOf(i);
             if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
               foundTokens.push(i);
-              console.log(`✅ Found token ${i} in range search`);
+              logger.debug('✅ Found token %s in range search', i);
             }
           } catch (error) {
             continue;
           }
         }
         
-        console.log(`📊 Range ${range.start}-${range.end}: Found ${foundTokens.length} tokens so far`);
+        logger.debug('📊 Range %s-%s: Found %s tokens so far', range.start, range.end, foundTokens.length);
       }
     
           // Strategy B: Mega-random sampling across extreme ranges
       if (foundTokens.length < 8) {
-        console.log('🔍 Strategy B: Mega-random sampling...');
+        logger.debug('🔍 Strategy B: Mega-random sampling...');
         const megaRandomPoints = [
           // Low ranges
           12345, 23456, 34567, 45678, 56789, 67890, 78901, 89012,
@@ -968,13 +1224,13 @@ class AdminWalletService {
           10000000000, 20000000000, 30000000000, 40000000000, 50000000000, 60000000000, 70000000000, 80000000000, 90000000000
         ];
         
-        console.log('🔍 Checking mega random points...');
+        logger.debug('🔍 Checking mega random points...');
         for (const tokenId of megaRandomPoints) {
           try {
             const owner = await this.nftContract.ownerOf(tokenId);
             if (owner.toLowerCase() === this.adminAddress.toLowerCase()) {
               foundTokens.push(tokenId);
-              console.log(`✅ Found mega-random token ${tokenId}`);
+              logger.debug('✅ Found mega-random token %s', tokenId);
               if (foundTokens.length >= 8) break;
             }
           } catch (error) {
@@ -985,21 +1241,21 @@ class AdminWalletService {
     
     // Strategy C: Check if this is ERC-1155 (different contract type)
     if (foundTokens.length < 8) {
-      console.log('🔍 Strategy C: Checking for ERC-1155...');
+      logger.debug('🔍 Strategy C: Checking for ERC-1155...');
       try {
         // Try to call ERC-1155 balanceOf function
         const balance1155 = await this.nftContract.balanceOf(this.adminAddress, 1);
-        console.log(`📊 ERC-1155 balance for token 1: ${balance1155.toString()}`);
+        logger.debug('📊 ERC-1155 balance for token 1: %s', balance1155.toString());
         
         if (balance1155 > 0) {
-          console.log('🎯 This might be an ERC-1155 contract!');
+          logger.debug('🎯 This might be an ERC-1155 contract!');
           // Check a few more token IDs
           for (let i = 1; i <= 10; i++) {
             try {
               const balance = await this.nftContract.balanceOf(this.adminAddress, i);
               if (balance > 0) {
                 foundTokens.push(i);
-                console.log(`✅ Found ERC-1155 token ${i} with balance ${balance}`);
+                logger.debug('✅ Found ERC-1155 token %s with balance %s', i, balance.toString());
               }
             } catch (error) {
               continue;
@@ -1007,11 +1263,11 @@ class AdminWalletService {
           }
         }
       } catch (error) {
-        console.log('📊 Not ERC-1155 or error checking:', error.message);
+        logger.debug('📊 Not ERC-1155 or error checking:', error.message);
       }
     }
     
-    console.log(`📊 Ultra-smart search found ${foundTokens.length} tokens`);
+    logger.debug('📊 Ultra-smart search found %s tokens', foundTokens.length);
     return foundTokens;
   }
 
@@ -1020,35 +1276,36 @@ class AdminWalletService {
    */
   async checkNFTStatus() {
     try {
-      console.log('🔍 Quick NFT Status Check...\n');
-      
-      // First, detect contract type
-      const contractType = await this.detectContractType();
-      console.log(`📋 Contract Type: ${contractType}`);
+      logger.debug('🔍 Quick NFT Status Check...\n');
       
-      const nftInfo = await this.getAdminNFTBalance();
+      // Detect contract type and read the balance in the same batch
+      const [contractType, nftInfo] = await Promise.all([
+        this.detectContractType(),
+        this.getAdminNFTBalance()
+      ]);
+      logger.debug('📋 Contract Type: %s', contractType);
       
-      console.log('📊 NFT Status Summary:');
-      console.log(`   Total Balance: ${nftInfo.total}`);
-      console.log(`   Found Tokens: ${nftInfo.count}`);
-      console.log(`   Token IDs: [${nftInfo.ownedTokens.join(', ')}]`);
+      logger.debug('📊 NFT Status Summary:');
+      logger.debug('   Total Balance: %s', nftInfo.total);
+      logger.debug('   Found Tokens: %s', nftInfo.count);
+      logger.debug('   Token IDs: [%s]', nftInfo.ownedTokens.join(', '));
       
       if (nftInfo.count === 0) {
-        console.log('⚠️  No NFTs found in admin wallet!');
-        console.log('🔍 This might be due to:');
-        console.log('   1. NFTs in very high token ID ranges');
-        console.log('   2. Different contract type (ERC-1155)');
-        console.log('   3. Contract balance vs actual ownership mismatch');
+        logger.warn('⚠️  No NFTs found in admin wallet!');
+        logger.debug('🔍 This might be due to:');
+        logger.debug('   1. NFTs in very high token ID ranges');
+        logger.debug('   2. Different contract type (ERC-1155)');
+        logger.debug('   3. Contract balance vs actual ownership mismatch');
       } else if (nftInfo.count < 5) {
-        console.log('⚠️  Low NFT balance - consider adding more NFTs');
+        logger.warn('⚠️  Low NFT balance - consider adding more NFTs');
       } else {
-        console.log('✅ Sufficient NFT balance for rewards');
+        logger.debug('✅ Sufficient NFT balance for rewards');
       }
       
       return nftInfo;
       
     } catch (error) {
-      console.error('Error checking NFT status:', error);
+      logger.error('Error checking NFT status:', error);
       return null;
     }
   }
@@ -1057,41 +1314,47 @@ class AdminWalletService {
    * Detect NFT contract type
    */
   async detectContractType() {
+    if (this.contractType) {
+      return this.contractType;
+    }
+    
     try {
-      console.log('🔍 Detecting contract type...');
+      logger.debug('🔍 Detecting contract type...');
       
       // Try ERC-721 first (standard NFT)
       try {
         const owner = await this.nftContract.ownerOf(1);
-        console.log('✅ Contract supports ERC-721 (ownerOf function)');
-        return 'ERC-721';
+        logger.debug('✅ Contract supports ERC-721 (ownerOf function)');
+        this.contractType = 'ERC-721';
+        return this.contractType;
       } catch (error) {
-        console.log('❌ Not ERC-721 (ownerOf failed)');
+        logger.debug('❌ Not ERC-721 (ownerOf failed)');
       }
       
       // Try ERC-1155 (multi-token)
       try {
         const balance = await this.nftContract.balanceOf(this.adminAddress, 1);
-        console.log(`✅ Contract supports ERC-1155 (balanceOf function) - Balance: ${balance.toString()}`);
-        return 'ERC-1155';
+        logger.debug('✅ Contract supports ERC-1155 (balanceOf function) - Balance: %s', balance.toString());
+        this.contractType = 'ERC-1155';
+        return this.contractType;
       } catch (error) {
-        console.log('❌ Not ERC-1155 (balanceOf failed)');
+        logger.debug('❌ Not ERC-1155 (balanceOf failed)');
       }
       
       // Try other common functions
       try {
         const totalSupply = await this.nftContract.totalSupply();
-        console.log(`✅ Contract has totalSupply: ${totalSupply.toString()}`);
+        logger.debug('✅ Contract has totalSupply: %s', totalSupply.toString());
         return 'Unknown (has totalSupply)';
       } catch (error) {
-        console.log('❌ No totalSupply function');
+        logger.debug('❌ No totalSupply function');
       }
       
-      console.log('⚠️  Contract type unknown - might be custom implementation');
+      logger.warn('⚠️  Contract type unknown - might be custom implementation');
       return 'Unknown';
       
     } catch (error) {
-      console.error('Error detecting contract type:', error);
+      logger.error('Error detecting contract type:', error);
       return 'Error';
     }
   }
@@ -1099,8 +1362,11 @@ class AdminWalletService {
   /**
    * Check if admin wallet has sufficient funds
    */
-  async checkAdminFunds() {
-    const balance = await this.getAdminBalance();
+  async checkAdminFunds(balance) {
+    // Callers that already have the formatted Gianky balance pass it in
+    if (balance === undefined) {
+      balance = await this.getAdminBalance();
+    }
     const required = 5; // 5 Gianky tokens (for testing, 50 for production)
     return {
       balance: parseFloat(balance),
@@ -0,0 +1,48 @@
+/**
+ * Token amount conversion for the Gianky backend
+ * Shared by the request validators and the admin wallet service
+ */
+
+const { ethers } = require('ethers');
+
+/**
+ * Write a number in plain decimal, since parseEther rejects exponent notation
+ *
+ * Uses the shortest round-trip digits of the number (1e-7 -> "0.0000001"),
+ * not its exact binary value, so 0.1 stays "0.1".
+ */
+function toPlainDecimal(value) {
+  const [coefficient, exponent] = String(value).split('e');
+  if (exponent === undefined) {
+    return coefficient;
+  }
+
+  const sign = coefficient.startsWith('-') ? '-' : '';
+  const [whole, fraction = ''] = coefficient.replace('-', '').split('.');
+  const digits = whole + fraction;
+  const point = whole.length + Number(exponent);
+
+  if (point <= 0) {
+    return `${sign}0.${'0'.repeat(-point)}${digits}`;
+  }
+  if (point >= digits.length) {
+    return sign + digits + '0'.repeat(point - digits.length);
+  }
+  return `${sign}${digits.slice(0, point)}.${digits.slice(point)}`;
+}
+
+/**
+ * Convert a positive token amount (18 decimals) to wei without float multiplication
+ *
+ * Throws for amounts that are not positive or need more than 18 decimals,
+ * rather than rounding them to a different amount (or to nothing).
+ */
+function toWei(amount) {
+  const wei = ethers.parseEther(typeof amount === 'number' ? toPlainDecimal(amount) : String(amount));
+  if (wei <= 0n) {
+    throw new Error(`Amount must be positive: ${amount}`);
+  }
+  return wei;
+}
+
+module.exports = { toWei };
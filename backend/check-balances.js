@@ -23,7 +23,7 @@ async function checkBalances() {
     console.log('');
     
     // Check if sufficient funds for operations
-    const fundsCheck = await adminService.checkAdminFunds();
+    const fundsCheck = await adminService.checkAdminFunds(balances.giankyFormatted);
     console.log('💰 Funds Status:');
     console.log(`   Required: ${fundsCheck.required} GIANKY`);
     console.log(`   Available: ${fundsCheck.balance} GIANKY`);
@@ -3,27 +3,20 @@
  */
 
 const { ethers } = require('ethers');
+const { getProvider } = require('./provider');
+const { GIANKY_NFT_ADDRESS, NFT_ABI } = require('./contracts');
 require('dotenv').config();
 
 async function checkNFTContract() {
   try {
-    const provider = new ethers.JsonRpcProvider(process.env.POLYGON_RPC_URL);
+    const provider = getProvider();
     const adminWallet = new ethers.Wallet(process.env.ADMIN_PRIVATE_KEY, provider);
     
-    const nftContractAddress = '0xdc91E2fD661E88a9a1bcB1c826B5579232fc9898';
+    const nftContractAddress = GIANKY_NFT_ADDRESS;
     
     // Extended ABI with more functions
     const extendedABI = [
-      'function mint(address to, uint256 tokenId)',
-      'function safeMint(address to, uint256 tokenId)',
-      'function mintTo(address to, uint256 tokenId)',
-      'function mintNFT(address to, uint256 tokenId)',
-      'function createToken(address to, uint256 tokenId)',
-      'function balanceOf(address owner) view returns (uint256)',
-      'function ownerOf(uint256 tokenId) view returns (address)',
-      'function tokenURI(uint256 tokenId) view returns (string)',
-      'function totalSupply() view returns (uint256)',
-      'function tokenByIndex(uint256 index) view returns (uint256)',
+      ...NFT_ABI,
       'function owner() view returns (address)',
       'function hasRole(bytes32 role, address account) view returns (bool)',
       'function getRoleMember(bytes32 role, uint256 index) view returns (address)',
@@ -41,10 +34,12 @@ async function checkNFTContract() {
     
     // Check basic contract info
     try {
-      const name = await nftContract.name();
-      const symbol = await nftContract.symbol();
-      const totalSupply = await nftContract.totalSupply();
-      const paused = await nftContract.paused();
+      const [name, symbol, totalSupply, paused] = await Promise.all([
+        nftContract.name(),
+        nftContract.symbol(),
+        nftContract.totalSupply(),
+        nftContract.paused()
+      ]);
       
       console.log('📋 Contract Info:');
       console.log(`   Name: ${name}`);
@@ -67,11 +62,15 @@ async function checkNFTContract() {
     
     // Check roles
     try {
-      const minterRole = await nftContract.MINTER_ROLE();
-      const adminRole = await nftContract.DEFAULT_ADMIN_ROLE();
+      const [minterRole, adminRole] = await Promise.all([
+        nftContract.MINTER_ROLE(),
+        nftContract.DEFAULT_ADMIN_ROLE()
+      ]);
       
-      const hasMinterRole = await nftContract.hasRole(minterRole, adminWallet.address);
-      const hasAdminRole = await nftContract.hasRole(adminRole, adminWallet.address);
+      const [hasMinterRole, hasAdminRole] = await Promise.all([
+        nftContract.hasRole(minterRole, adminWallet.address),
+        nftContract.hasRole(adminRole, adminWallet.address)
+      ]);
       
       console.log('\n🔐 Role Permissions:');
       console.log(`   MINTER_ROLE: ${hasMinterRole}`);
@@ -0,0 +1,36 @@
+/**
+ * Gianky contract addresses and ABIs
+ * Shared by the admin wallet service and the maintenance scripts
+ */
+
+const GIANKY_TOKEN_ADDRESS = '0x370806781689e670f85311700445449ac7c3ff7a';
+const GIANKY_NFT_ADDRESS = '0xdc91E2fD661E88a9a1bcB1c826B5579232fc9898';
+
+const TOKEN_ABI = Object.freeze([
+  'function transfer(address to, uint256 amount) returns (bool)',
+  'function balanceOf(address account) view returns (uint256)',
+  'function approve(address spender, uint256 amount) returns (bool)',
+  'function transferFrom(address from, address to, uint256 amount) returns (bool)'
+]);
+
+const NFT_ABI = Object.freeze([
+  'function mint(address to, uint256 tokenId)',
+  'function safeMint(address to, uint256 tokenId)',
+  'function mintTo(address to, uint256 tokenId)',
+  'function mintNFT(address to, uint256 tokenId)',
+  'function createToken(address to, uint256 tokenId)',
+  'function balanceOf(address owner) view returns (uint256)',
+  'function ownerOf(uint256 tokenId) view returns (address)',
+  'function tokenURI(uint256 tokenId) view returns (string)',
+  'function totalSupply() view returns (uint256)',
+  'function tokenByIndex(uint256 index) view returns (uint256)',
+  'function tokenOfOwnerByIndex(address owner, uint256 index) view returns (uint256)',
+  'function transferFrom(address from, address to, uint256 tokenId)'
+]);
+
+module.exports = {
+  GIANKY_TOKEN_ADDRESS,
+  GIANKY_NFT_ADDRESS,
+  TOKEN_ABI,
+  NFT_ABI
+};
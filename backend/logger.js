@@ -0,0 +1,40 @@
+/**
+ * Leveled logger for the Gianky backend
+ * Calls below LOG_LEVEL return without formatting or writing anything;
+ * arguments are still evaluated by the caller before the call
+ */
+
+const util = require('util');
+require('dotenv').config();
+
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+
+const threshold = LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] || LEVELS.info;
+const jsonOutput = process.env.LOG_FORMAT === 'json';
+
+/**
+ * Build the logging function for one level
+ */
+function createLevel(level, write) {
+  if (LEVELS[level] < threshold) {
+    return () => {};
+  }
+
+  if (jsonOutput) {
+    // One JSON object per line so log collectors need no parsing rules
+    return (...args) => write(JSON.stringify({
+      time: new Date().toISOString(),
+      level,
+      msg: util.format(...args)
+    }));
+  }
+
+  return (...args) => write(...args);
+}
+
+module.exports = {
+  debug: createLevel('debug', console.log),
+  info: createLevel('info', console.log),
+  warn: createLevel('warn', console.warn),
+  error: createLevel('error', console.error)
+};
@@ -0,0 +1,110 @@
+/**
+ * Shared JSON-RPC provider for the Gianky backend
+ * One provider per RPC URL for the whole process
+ */
+
+const http = require('http');
+const https = require('https');
+const { ethers } = require('ethers');
+const logger = require('./logger');
+require('dotenv').config();
+
+const RPC_MAX_SOCKETS = Number(process.env.RPC_MAX_SOCKETS || 64);
+const RPC_BREAKER_FAILURES = Number(process.env.RPC_BREAKER_FAILURES || 5);
+const RPC_BREAKER_RESET_MS = Number(process.env.RPC_BREAKER_RESET_MS || 30000);
+// Same node ethers' JsonRpcProvider falls back to when it is given no URL
+const DEFAULT_RPC_URL = 'http://localhost:8545';
+
+// Keep-alive agents reused by every provider, so RPC calls go over open
+// sockets instead of paying a TCP/TLS handshake each time. maxSockets also
+// caps how many requests are in flight to a node; the rest wait in the agent.
+const agents = {
+  http: new http.Agent({ keepAlive: true, maxSockets: RPC_MAX_SOCKETS }),
+  https: new https.Agent({ keepAlive: true, maxSockets: RPC_MAX_SOCKETS })
+};
+
+const providers = new Map();
+
+/**
+ * Wrap an ethers getUrl function with a circuit breaker
+ *
+ * After RPC_BREAKER_FAILURES transport errors or 5xx responses in a row,
+ * calls fail immediately with "RPC unavailable" for RPC_BREAKER_RESET_MS
+ * instead of waiting on a node that is down. After that, one call at a
+ * time goes through as a probe while the rest keep failing fast; a
+ * successful probe closes the breaker and a failed one reopens it.
+ */
+function withCircuitBreaker(getUrl) {
+  let failures = 0;
+  let openUntil = 0;
+  let probing = false;
+
+  const recordFailure = () => {
+    failures++;
+    if (failures >= RPC_BREAKER_FAILURES) {
+      if (failures === RPC_BREAKER_FAILURES) {
+        logger.error('❌ RPC circuit open after %s failures', failures);
+      }
+      openUntil = Date.now() + RPC_BREAKER_RESET_MS;
+    }
+  };
+
+  return async (req, signal) => {
+    const open = failures >= RPC_BREAKER_FAILURES;
+    if (open && (probing || Date.now() < openUntil)) {
+      const error = new Error('RPC unavailable');
+      error.code = 'SERVER_ERROR';
+      throw error;
+    }
+    if (open) {
+      probing = true;
+    }
+
+    let resp;
+    try {
+      resp = await getUrl(req, signal);
+    } catch (error) {
+      recordFailure();
+      throw error;
+    } finally {
+      if (open) {
+        probing = false;
+      }
+    }
+
+    if (resp.statusCode >= 500) {
+      recordFailure();
+    } else {
+      if (failures >= RPC_BREAKER_FAILURES) {
+        logger.info('✅ RPC circuit closed');
+      }
+      failures = 0;
+    }
+
+    return resp;
+  };
+}
+
+/**
+ * Get the process-wide provider for an RPC URL
+ *
+ * The network is fixed from POLYGON_CHAIN_ID, so ethers does not send an
+ * extra eth_chainId before every call to check that the network changed.
+ */
+function getProvider(rpcUrl = process.env.POLYGON_RPC_URL || DEFAULT_RPC_URL) {
+  let provider = providers.get(rpcUrl);
+
+  if (!provider) {
+    const network = ethers.Network.from(Number(process.env.POLYGON_CHAIN_ID || 137));
+    const request = new ethers.FetchRequest(rpcUrl);
+    const agent = rpcUrl.startsWith('https:') ? agents.https : agents.http;
+    request.getUrlFunc = withCircuitBreaker(ethers.FetchRequest.createGetUrlFunc({ agent }));
+
+    provider = new ethers.JsonRpcProvider(request, network, { staticNetwork: network });
+    providers.set(rpcUrl, provider);
+  }
+
+  return provider;
+}
+
+module.exports = { getProvider };
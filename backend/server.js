@@ -5,134 +5,310 @@
 
 const express = require('express');
 const cors = require('cors');
+const { ethers } = require('ethers');
 const AdminWalletService = require('./admin-wallet-service');
+const { toWei } = require('./amounts');
+const logger = require('./logger');
 require('dotenv').config();
 
 const app = express();
 const PORT = process.env.PORT || 5001;
+const MAX_TRANSACTIONS_PER_USER_PER_DAY = parseInt(process.env.MAX_TRANSACTIONS_PER_USER_PER_DAY, 10) || 100;
+
+// Responses are small dynamic JSON; skip hashing each body for an ETag
+app.set('etag', false);
+app.disable('x-powered-by');
+
+// Browser origins allowed by CORS_ORIGIN (comma-separated); any origin when unset
+const corsOrigins = new Set(
+  (process.env.CORS_ORIGIN || '').split(',').map(origin => origin.trim()).filter(Boolean)
+);
 
 // Middleware
-app.use(cors());
+app.use(cors({
+  origin: corsOrigins.size > 0
+    ? (origin, callback) => callback(null, !origin || corsOrigins.has(origin))
+    : '*',
+  maxAge: 86400 // Let browsers cache preflight responses for a day
+}));
 app.use(express.json());
 
 // Initialize admin wallet service
 const adminWalletService = new AdminWalletService();
 
-// API Routes
+/**
+ * Build a sender for a fixed error response, serialized once up front
+ */
+function errorResponse(status, error) {
+  const body = JSON.stringify({ success: false, error });
+  return res => res.status(status).type('json').send(body);
+}
+
+const sendInternalError = errorResponse(500, 'Internal server error');
+const sendDailyLimitReached = errorResponse(429, 'Daily transaction limit reached');
+const sendRequestInProgress = errorResponse(409, 'A request with this Idempotency-Key is still in progress');
 
 /**
- * Process game fee payment (GASLESS)
+ * Build middleware that checks each named body field with its validator
  */
-app.post('/api/game/process-fee', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
+function validateBody(fields, error) {
+  const checks = Object.entries(fields);
+  const sendInvalid = errorResponse(400, error);
+  return (req, res, next) => {
+    const body = req.body || {};
+    for (const [name, isValid] of checks) {
+      if (!isValid(body[name])) {
+        return sendInvalid(res);
+      }
     }
-    
-    console.log(`Processing game fee for ${userAddress}`);
-    
-    // Process game fee payment
-    const result = await adminWalletService.processGameFee(userAddress);
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        feeTxHash: result.feeTxHash,
-        message: 'Game fee processed successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
+    next();
+  };
+}
+
+// 0x plus 40 hex digits; anything else is rejected before the checksum cache.
+// Without the prefix ethers would treat the value as an ENS name
+const HEX_ADDRESS = /^0x[0-9a-fA-F]{40}$/;
+// Hex addresses in a single case carry no checksum, so the pattern alone decides
+const PLAIN_HEX_ADDRESS = /^0x([0-9a-f]{40}|[0-9A-F]{40})$/;
+// Checksummed addresses already verified (keccak per check), oldest evicted first
+const CHECKSUM_CACHE_SIZE = 4096;
+const checkedAddresses = new Map();
+
+function isUserAddress(value) {
+  if (typeof value !== 'string' || !HEX_ADDRESS.test(value)) {
+    return false;
+  }
+  if (PLAIN_HEX_ADDRESS.test(value)) {
+    return true;
+  }
+
+  let valid = checkedAddresses.get(value);
+  if (valid === undefined) {
+    valid = ethers.isAddress(value);
+    if (checkedAddresses.size >= CHECKSUM_CACHE_SIZE) {
+      checkedAddresses.delete(checkedAddresses.keys().next().value);
     }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
-      success: false,
-      error: 'Internal server error'
-    });
+    checkedAddresses.set(value, valid);
   }
-});
+  return valid;
+}
 
 /**
- * Process user-paid game fee (USER PAYS, ADMIN SENDS REWARD)
+ * Key for a validated user address, the same in any letter case
+ */
+const addressKey = userAddress => userAddress.toLowerCase();
+
+/**
+ * Accept positive amounts that convert to a whole number of wei (at most 18 decimals)
  */
-app.post('/api/game/process-user-paid-fee', async (req, res) => {
+function isRewardAmount(value) {
+  if (typeof value !== 'number' && typeof value !== 'string') {
+    return false;
+  }
   try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
+    toWei(value);
+    return true;
+  } catch (error) {
+    return false;
+  }
+}
+
+// Reject requests that do not name a valid user address (and amount, for token rewards)
+const requireUserAddress = validateBody(
+  { userAddress: isUserAddress },
+  'Missing or invalid user address'
+);
+const requireUserAddressAndAmount = validateBody(
+  { userAddress: isUserAddress, amount: isRewardAmount },
+  'Missing or invalid user address or amount'
+);
+
+// Per-user token buckets: each holds up to MAX_TRANSACTIONS_PER_USER_PER_DAY
+// transactions and refills continuously over 24 hours
+const DAILY_LIMIT_WINDOW_MS = 24 * 60 * 60 * 1000;
+const DAILY_LIMIT_REFILL_PER_MS = MAX_TRANSACTIONS_PER_USER_PER_DAY / DAILY_LIMIT_WINDOW_MS;
+// Most users tracked at once; the least recently active bucket is evicted
+// first, so a flood of new addresses cannot grow memory without bound
+const DAILY_LIMIT_MAX_USERS = 100000;
+const dailyTransactionBuckets = new Map();
+
+/**
+ * Take one admin-funded transaction from a user's bucket; false once it is empty
+ */
+function consumeDailyTransaction(userAddress) {
+  const now = Date.now();
+  const key = addressKey(userAddress);
+  const bucket = dailyTransactionBuckets.get(key);
+  
+  if (!bucket) {
+    if (dailyTransactionBuckets.size >= DAILY_LIMIT_MAX_USERS) {
+      dailyTransactionBuckets.delete(dailyTransactionBuckets.keys().next().value);
     }
-    
-    console.log(`Processing user-paid game fee for ${userAddress}`);
-    
-    // For user-paid system, we just acknowledge the payment
-    // The actual payment happens on the frontend via user's wallet
-    // This endpoint is called after user has already paid
+    dailyTransactionBuckets.set(key, { tokens: MAX_TRANSACTIONS_PER_USER_PER_DAY - 1, refilledAt: now });
+    return MAX_TRANSACTIONS_PER_USER_PER_DAY >= 1;
+  }
+  
+  // Move to the back of the Map's insertion order, which keeps it in LRU order
+  dailyTransactionBuckets.delete(key);
+  dailyTransactionBuckets.set(key, bucket);
+  
+  bucket.tokens = Math.min(
+    MAX_TRANSACTIONS_PER_USER_PER_DAY,
+    bucket.tokens + (now - bucket.refilledAt) * DAILY_LIMIT_REFILL_PER_MS
+  );
+  bucket.refilledAt = now;
+  
+  if (bucket.tokens < 1) {
+    return false;
+  }
+  bucket.tokens -= 1;
+  return true;
+}
+
+// Drop buckets that have refilled completely, since a missing bucket means the same thing
+setInterval(() => {
+  const now = Date.now();
+  for (const [key, bucket] of dailyTransactionBuckets) {
+    if (bucket.tokens + (now - bucket.refilledAt) * DAILY_LIMIT_REFILL_PER_MS >= MAX_TRANSACTIONS_PER_USER_PER_DAY) {
+      dailyTransactionBuckets.delete(key);
+    }
+  }
+}, 60 * 60 * 1000).unref();
+
+/**
+ * Limit each user to MAX_TRANSACTIONS_PER_USER_PER_DAY admin-funded transactions
+ */
+function limitDailyTransactions(req, res, next) {
+  if (!consumeDailyTransaction(req.body.userAddress)) {
+    return sendDailyLimitReached(res);
+  }
+  next();
+}
+
+// Final responses by Idempotency-Key, so a retried reward request is not paid twice
+const IDEMPOTENCY_TTL_MS = 24 * 60 * 60 * 1000;
+const idempotentResponses = new Map();
+
+/**
+ * Replay the stored response when a client retries with the same Idempotency-Key
+ *
+ * Successful responses and 5xx responses are kept. A 5xx, such as a 504 for a
+ * receipt timeout, means a transfer may still be mined, so retrying it could
+ * pay twice. A 4xx means nothing was paid, so it releases the key and the
+ * client can retry under it.
+ */
+function idempotent(req, res, next) {
+  const idempotencyKey = req.get('Idempotency-Key');
+  if (!idempotencyKey) {
+    return next();
+  }
+  
+  const now = Date.now();
+  const key = `${req.path}:${addressKey(req.body.userAddress)}:${idempotencyKey}`;
+  const stored = idempotentResponses.get(key);
+  
+  if (stored && stored.expiresAt > now) {
+    if (stored.body === undefined) {
+      return sendRequestInProgress(res);
+    }
+    res.set('Idempotent-Replayed', 'true');
+    return res.status(stored.status).type('json').send(stored.body);
+  }
+  
+  const entry = { expiresAt: now + IDEMPOTENCY_TTL_MS, status: 0, body: undefined };
+  idempotentResponses.set(key, entry);
+  
+  const send = res.send;
+  res.send = function (body) {
+    if (res.statusCode < 400 || res.statusCode >= 500) {
+      entry.status = res.statusCode;
+      entry.body = body;
+    } else if (idempotentResponses.get(key) === entry) {
+      idempotentResponses.delete(key);
+    }
+    return send.call(this, body);
+  };
+  
+  next();
+}
+
+// Drop stored responses once their key has expired
+setInterval(() => {
+  const now = Date.now();
+  for (const [key, stored] of idempotentResponses) {
+    if (stored.expiresAt <= now) {
+      idempotentResponses.delete(key);
+    }
+  }
+}, 60 * 60 * 1000).unref();
+
+// API Routes
+
+/**
+ * Process game fee payment (GASLESS)
+ */
+app.post('/api/game/process-fee', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing game fee for %s', userAddress);
+  
+  // Process game fee payment
+  const result = await adminWalletService.processGameFee(userAddress);
+  
+  if (result.success) {
     res.json({
       success: true,
-      feeTxHash: 'user-paid',
-      message: 'User payment acknowledged! Admin will send reward.'
+      feeTxHash: result.feeTxHash,
+      message: 'Game fee processed successfully!'
     });
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
 
+/**
+ * Process user-paid game fee (USER PAYS, ADMIN SENDS REWARD)
+ */
+app.post('/api/game/process-user-paid-fee', requireUserAddress, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing user-paid game fee for %s', userAddress);
+  
+  // For user-paid system, we just acknowledge the payment
+  // The actual payment happens on the frontend via user's wallet
+  // This endpoint is called after user has already paid
+  res.json({
+    success: true,
+    feeTxHash: 'user-paid',
+    message: 'User payment acknowledged! Admin will send reward.'
+  });
+});
+
 /**
  * Process Gianky token reward (GASLESS)
  */
-app.post('/api/rewards/gianky', async (req, res) => {
-  try {
-    const { userAddress, amount } = req.body;
-    
-    if (!userAddress || !amount) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address or amount'
-      });
-    }
-    
-    console.log(`Processing Gianky reward: ${amount} GIANKY for ${userAddress}`);
-    
-    // Process Gianky reward
-    const result = await adminWalletService.processGiankyReward(userAddress, amount);
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        amount: amount,
-        message: `${amount} Gianky tokens sent successfully!`
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/gianky', requireUserAddressAndAmount, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress, amount } = req.body;
+  
+  logger.info('Processing Gianky reward: %s GIANKY for %s', amount, userAddress);
+  
+  // Process Gianky reward
+  const result = await adminWalletService.processGiankyReward(userAddress, amount);
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      amount: amount,
+      message: `${amount} Gianky tokens sent successfully!`
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -140,41 +316,25 @@ app.post('/api/rewards/gianky', async (req, res) => {
 /**
  * Process MATIC reward (GASLESS)
  */
-app.post('/api/rewards/matic', async (req, res) => {
-  try {
-    const { userAddress, amount } = req.body;
-    
-    if (!userAddress || !amount) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address or amount'
-      });
-    }
-    
-    console.log(`Processing MATIC reward: ${amount} MATIC for ${userAddress}`);
-    
-    // Process MATIC reward
-    const result = await adminWalletService.processMaticReward(userAddress, amount);
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        amount: amount,
-        message: `${amount} MATIC sent successfully!`
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/matic', requireUserAddressAndAmount, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress, amount } = req.body;
+  
+  logger.info('Processing MATIC reward: %s MATIC for %s', amount, userAddress);
+  
+  // Process MATIC reward
+  const result = await adminWalletService.processMaticReward(userAddress, amount);
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      amount: amount,
+      message: `${amount} MATIC sent successfully!`
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -182,41 +342,25 @@ app.post('/api/rewards/matic', async (req, res) => {
 /**
  * Process NFT reward - Starter NFT (GASLESS)
  */
-app.post('/api/rewards/nft/starter', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing Starter NFT reward for ${userAddress}`);
-    
-    // Process Starter NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '🎯 Starter NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '🎯 Starter NFT',
-        message: 'Starter NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/starter', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing Starter NFT reward for %s', userAddress);
+  
+  // Process Starter NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '🎯 Starter NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '🎯 Starter NFT',
+      message: 'Starter NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -224,41 +368,25 @@ app.post('/api/rewards/nft/starter', async (req, res) => {
 /**
  * Process NFT reward - Basic NFT (GASLESS)
  */
-app.post('/api/rewards/nft/basic', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing Basic NFT reward for ${userAddress}`);
-    
-    // Process Basic NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '⭐ Basic NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '⭐ Basic NFT',
-        message: 'Basic NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/basic', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing Basic NFT reward for %s', userAddress);
+  
+  // Process Basic NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '⭐ Basic NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '⭐ Basic NFT',
+      message: 'Basic NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -266,41 +394,25 @@ app.post('/api/rewards/nft/basic', async (req, res) => {
 /**
  * Process NFT reward - Standard NFT (GASLESS)
  */
-app.post('/api/rewards/nft/standard', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing Standard NFT reward for ${userAddress}`);
-    
-    // Process Standard NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '🏅 Standard NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '🏅 Standard NFT',
-        message: 'Standard NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/standard', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing Standard NFT reward for %s', userAddress);
+  
+  // Process Standard NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '🏅 Standard NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '🏅 Standard NFT',
+      message: 'Standard NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -308,41 +420,25 @@ app.post('/api/rewards/nft/standard', async (req, res) => {
 /**
  * Process NFT reward - VIP NFT (GASLESS)
  */
-app.post('/api/rewards/nft/vip', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing VIP NFT reward for ${userAddress}`);
-    
-    // Process VIP NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '👑 VIP NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '👑 VIP NFT',
-        message: 'VIP NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/vip', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing VIP NFT reward for %s', userAddress);
+  
+  // Process VIP NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '👑 VIP NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '👑 VIP NFT',
+      message: 'VIP NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -350,41 +446,25 @@ app.post('/api/rewards/nft/vip', async (req, res) => {
 /**
  * Process NFT reward - Premium NFT (GASLESS)
  */
-app.post('/api/rewards/nft/premium', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing Premium NFT reward for ${userAddress}`);
-    
-    // Process Premium NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '💎 Premium NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '💎 Premium NFT',
-        message: 'Premium NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/premium', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing Premium NFT reward for %s', userAddress);
+  
+  // Process Premium NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '💎 Premium NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '💎 Premium NFT',
+      message: 'Premium NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
@@ -392,52 +472,101 @@ app.post('/api/rewards/nft/premium', async (req, res) => {
 /**
  * Process NFT reward - Diamond NFT (GASLESS)
  */
-app.post('/api/rewards/nft/diamond', async (req, res) => {
-  try {
-    const { userAddress } = req.body;
-    
-    if (!userAddress) {
-      return res.status(400).json({
-        success: false,
-        error: 'Missing user address'
-      });
-    }
-    
-    console.log(`Processing Diamond NFT reward for ${userAddress}`);
-    
-    // Process Diamond NFT reward
-    const result = await adminWalletService.processNFTReward(userAddress, '💍 Diamond NFT');
-    
-    if (result.success) {
-      res.json({
-        success: true,
-        rewardTxHash: result.rewardTxHash,
-        nftType: '💍 Diamond NFT',
-        message: 'Diamond NFT sent successfully!'
-      });
-    } else {
-      res.status(400).json({
-        success: false,
-        error: result.error
-      });
-    }
-    
-  } catch (error) {
-    console.error('API Error:', error);
-    res.status(500).json({
+app.post('/api/rewards/nft/diamond', requireUserAddress, idempotent, limitDailyTransactions, async (req, res) => {
+  const { userAddress } = req.body;
+  
+  logger.info('Processing Diamond NFT reward for %s', userAddress);
+  
+  // Process Diamond NFT reward
+  const result = await adminWalletService.processNFTReward(userAddress, '💍 Diamond NFT');
+  
+  if (result.success) {
+    res.json({
+      success: true,
+      rewardTxHash: result.rewardTxHash,
+      nftType: '💍 Diamond NFT',
+      message: 'Diamond NFT sent successfully!'
+    });
+  } else {
+    res.status(result.pending ? 504 : 400).json({
       success: false,
-      error: 'Internal server error'
+      error: result.error
     });
   }
 });
 
+/**
+ * Calls accepted by the batch endpoint, keyed by their route path
+ */
+const BATCH_METHODS = new Map([
+  ['game/process-fee', ({ userAddress }) => adminWalletService.processGameFee(userAddress)],
+  ['rewards/gianky', ({ userAddress, amount }) => adminWalletService.processGiankyReward(userAddress, amount)],
+  ['rewards/matic', ({ userAddress, amount }) => adminWalletService.processMaticReward(userAddress, amount)],
+  ['rewards/nft/starter', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '🎯 Starter NFT')],
+  ['rewards/nft/basic', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '⭐ Basic NFT')],
+  ['rewards/nft/standard', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '🏅 Standard NFT')],
+  ['rewards/nft/vip', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '👑 VIP NFT')],
+  ['rewards/nft/premium', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '💎 Premium NFT')],
+  ['rewards/nft/diamond', ({ userAddress }) => adminWalletService.processNFTReward(userAddress, '💍 Diamond NFT')]
+]);
+
+// Batch methods that also need an amount
+const BATCH_AMOUNT_METHODS = new Set(['rewards/gianky', 'rewards/matic']);
+
+const MAX_BATCH_CALLS = 20;
+
+/**
+ * Run several fee/reward calls in one HTTP request
+ *
+ * Body: { calls: [{ id, method, params, inputFrom }] }. Calls run in order
+ * because they all spend from the admin wallet; a call whose `inputFrom`
+ * call failed is skipped.
+ */
+app.post('/api/batch', async (req, res) => {
+  const calls = req.body?.calls;
+  
+  if (!Array.isArray(calls) || calls.length === 0 || calls.length > MAX_BATCH_CALLS) {
+    return res.status(400).json({
+      success: false,
+      error: `Batch must contain 1-${MAX_BATCH_CALLS} calls`
+    });
+  }
+  
+  logger.info('Processing batch of %s calls', calls.length);
+  
+  const results = [];
+  for (const [index, call] of calls.entries()) {
+    const id = call?.id ?? index;
+    const method = BATCH_METHODS.get(call?.method);
+    const params = call?.params || {};
+    const dependency = call?.inputFrom;
+    
+    if (!method) {
+      results.push({ id, success: false, error: `Unknown method: ${call?.method}` });
+    } else if (Number.isInteger(dependency) && dependency >= 0 && !results[dependency]?.success) {
+      results.push({ id, success: false, error: `Skipped: call ${dependency} did not succeed` });
+    } else if (!isUserAddress(params.userAddress) || (BATCH_AMOUNT_METHODS.has(call.method) && !isRewardAmount(params.amount))) {
+      results.push({ id, success: false, error: 'Missing or invalid user address or amount' });
+    } else if (!consumeDailyTransaction(params.userAddress)) {
+      results.push({ id, success: false, error: 'Daily transaction limit reached' });
+    } else {
+      results.push({ id, ...(await method(params)) });
+    }
+  }
+  
+  res.json({
+    success: results.every(result => result.success),
+    results
+  });
+});
+
 /**
  * Check admin wallet balance
  */
 app.get('/api/admin/balance', async (req, res) => {
   try {
     const allBalances = await adminWalletService.getAllBalances();
-    const funds = await adminWalletService.checkAdminFunds();
+    const funds = await adminWalletService.checkAdminFunds(allBalances.giankyFormatted);
     
     res.json({
       success: true,
@@ -462,7 +591,7 @@ app.get('/api/admin/balance', async (req, res) => {
  */
 app.get('/api/admin/nft-status', async (req, res) => {
   try {
-    console.log('🔍 NFT Status Check Requested');
+    logger.info('🔍 NFT Status Check Requested');
     
     const nftStatus = await adminWalletService.checkNFTStatus();
     
@@ -482,7 +611,7 @@ app.get('/api/admin/nft-status', async (req, res) => {
     }
     
   } catch (error) {
-    console.error('NFT Status Check Error:', error);
+    logger.error('NFT Status Check Error:', error);
     res.status(500).json({
       success: false,
       error: error.message
@@ -495,7 +624,7 @@ app.get('/api/admin/nft-status', async (req, res) => {
  */
 app.get('/api/admin/nft-details', async (req, res) => {
   try {
-    console.log('🔍 Detailed NFT Info Requested');
+    logger.info('🔍 Detailed NFT Info Requested');
     
     const nftBalance = await adminWalletService.getAdminNFTBalance();
     
@@ -514,7 +643,7 @@ app.get('/api/admin/nft-details', async (req, res) => {
     });
     
   } catch (error) {
-    console.error('NFT Details Error:', error);
+    logger.error('NFT Details Error:', error);
     res.status(500).json({
       success: false,
       error: error.message
@@ -527,7 +656,7 @@ app.get('/api/admin/nft-details', async (req, res) => {
  */
 app.get('/api/admin/nft-count', async (req, res) => {
   try {
-    console.log('🔍 Quick NFT Count Requested');
+    logger.info('🔍 Quick NFT Count Requested');
     
     const nftBalance = await adminWalletService.getAdminNFTBalance();
     
@@ -539,7 +668,7 @@ app.get('/api/admin/nft-count', async (req, res) => {
     });
     
   } catch (error) {
-    console.error('Quick NFT Count Error:', error);
+    logger.error('Quick NFT Count Error:', error);
     res.status(500).json({
       success: false,
       error: error.message
@@ -552,23 +681,19 @@ app.get('/api/admin/nft-count', async (req, res) => {
  */
 app.get('/api/admin/nft-debug', async (req, res) => {
   try {
-    console.log('🔍 NFT Debug Requested');
-    
-    // Get basic info
-    const nftBalance = await adminWalletService.getAdminNFTBalance();
+    logger.info('🔍 NFT Debug Requested');
     
-    // Try to find tokens manually
-    console.log('🔍 Manual token search...');
-    const manualSearch = await adminWalletService.findOwnedTokenIds();
+    // Basic info, a manual token search and the contract's totalSupply all
+    // go out together; identical owner lookups are shared by the provider
+    logger.info('🔍 Manual token search...');
+    const [nftBalance, manualSearch, totalSupply] = await Promise.all([
+      adminWalletService.getAdminNFTBalance(),
+      adminWalletService.findOwnedTokenIds(),
+      adminWalletService.getTotalSupply().catch(error => `Error: ${error.message}`)
+    ]);
     
     // Check contract directly
-    let contractInfo = {};
-    try {
-      const totalSupply = await adminWalletService.nftContract.totalSupply();
-      contractInfo.totalSupply = totalSupply.toString();
-    } catch (error) {
-      contractInfo.totalSupply = `Error: ${error.message}`;
-    }
+    const contractInfo = { totalSupply: totalSupply.toString() };
     
     res.json({
       success: true,
@@ -585,7 +710,7 @@ app.get('/api/admin/nft-debug', async (req, res) => {
     });
     
   } catch (error) {
-    console.error('NFT Debug Error:', error);
+    logger.error('NFT Debug Error:', error);
     res.status(500).json({
       success: false,
       error: error.message
@@ -593,14 +718,24 @@ app.get('/api/admin/nft-debug', async (req, res) => {
   }
 });
 
+// Health probes arrive every few seconds; the timestamp is rebuilt at most once a second
+let healthTimestampSecond = 0;
+let healthTimestamp = '';
+
 /**
  * Health check endpoint
  */
 app.get('/api/health', (req, res) => {
+  const second = Math.floor(Date.now() / 1000);
+  if (second !== healthTimestampSecond) {
+    healthTimestampSecond = second;
+    healthTimestamp = new Date(second * 1000).toISOString();
+  }
+  
   res.json({
     success: true,
     message: 'Gianky Game Backend is running',
-    timestamp: new Date().toISOString()
+    timestamp: healthTimestamp
   });
 });
 
@@ -609,11 +744,13 @@ app.get('/api/health', (req, res) => {
  */
 app.get('/api/health/provider', async (req, res) => {
   try {
-    console.log('🔍 Provider health check requested...');
+    logger.info('🔍 Provider health check requested...');
     
-    // Test provider connection
-    const network = await adminWalletService.provider.getNetwork();
-    const blockNumber = await adminWalletService.provider.getBlockNumber();
+    // Test provider connection (both reads go out as one JSON-RPC batch)
+    const [network, blockNumber] = await Promise.all([
+      adminWalletService.provider.getNetwork(),
+      adminWalletService.provider.getBlockNumber()
+    ]);
     
     res.json({
       success: true,
@@ -625,7 +762,7 @@ app.get('/api/health/provider', async (req, res) => {
     });
     
   } catch (error) {
-    console.error('❌ Provider health check failed:', error.message);
+    logger.error('❌ Provider health check failed:', error.message);
     res.status(500).json({
       success: false,
       provider: 'Disconnected',
@@ -635,6 +772,21 @@ app.get('/api/health/provider', async (req, res) => {
   }
 });
 
+/**
+ * Turn errors thrown by route handlers into a JSON 500
+ *
+ * Express 5 forwards rejected handler promises here, so the fee and reward
+ * routes need no try/catch of their own. Client errors such as malformed
+ * JSON keep Express's default handling.
+ */
+app.use((error, req, res, next) => {
+  if (res.headersSent || (error.status && error.status < 500)) {
+    return next(error);
+  }
+  logger.error('API Error (%s %s):', req.method, req.path, error);
+  sendInternalError(res);
+});
+
 // Start server
 app.listen(PORT, () => {
   console.log('✅ Environment configuration is valid!');
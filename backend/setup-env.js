@@ -12,13 +12,19 @@ ADMIN_ADDRESS=your_admin_wallet_address_here
 # Polygon Network Configuration
 POLYGON_RPC_URL=https://polygon-rpc.com
 POLYGON_CHAIN_ID=137
+RPC_MAX_SOCKETS=64
+RECEIPT_TIMEOUT_MS=120000
+RPC_BREAKER_FAILURES=5
+RPC_BREAKER_RESET_MS=30000
 
 # Server Configuration
 PORT=5001
 NODE_ENV=development
+LOG_LEVEL=info
 
 # Security
 CORS_ORIGIN=http://localhost:3000
+MAX_TRANSACTIONS_PER_USER_PER_DAY=100
 `;
 
 const envPath = path.join(__dirname, '.env');
@@ -3,14 +3,16 @@
  */
 
 const { ethers } = require('ethers');
+const { getProvider } = require('./provider');
+const { GIANKY_NFT_ADDRESS } = require('./contracts');
 require('dotenv').config();
 
 async function updateAdminWallet() {
   try {
-    const provider = new ethers.JsonRpcProvider(process.env.POLYGON_RPC_URL);
+    const provider = getProvider();
     
     // Get the actual contract owner
-    const nftContractAddress = '0xdc91E2fD661E88a9a1bcB1c826B5579232fc9898';
+    const nftContractAddress = GIANKY_NFT_ADDRESS;
     const nftContract = new ethers.Contract(nftContractAddress, [
       'function owner() view returns (address)'
     ], provider);
@@ -13,19 +13,33 @@ try {
   // Read wallet details
   const walletData = JSON.parse(fs.readFileSync(walletPath, 'utf8'));
   
-  // Read current .env file
-  let envContent = fs.readFileSync(envPath, 'utf8');
+  const updates = new Map([
+    ['ADMIN_PRIVATE_KEY', walletData.privateKey],
+    ['ADMIN_ADDRESS', walletData.address]
+  ]);
   
-  // Replace placeholder values with actual wallet details
-  envContent = envContent.replace(
-    'ADMIN_PRIVATE_KEY=your_admin_wallet_private_key_here',
-    `ADMIN_PRIVATE_KEY=${walletData.privateKey}`
-  );
+  // Rewrite matching KEY= lines in one pass, keeping comments and order;
+  // keys not already in the file are added at the end
+  const missing = new Set(updates.keys());
+  const lines = fs.readFileSync(envPath, 'utf8').split('\n').map(line => {
+    const separator = line.indexOf('=');
+    if (separator < 0) {
+      return line;
+    }
+
+    const key = line.slice(0, separator).trim();
+    if (!updates.has(key)) {
+      return line;
+    }
+    missing.delete(key);
+    return `${key}=${updates.get(key)}`;
+  });
+  
+  // Keep the trailing newline (empty last element) at the end of the file
+  const insertAt = lines[lines.length - 1] === '' ? lines.length - 1 : lines.length;
+  lines.splice(insertAt, 0, ...[...missing].map(key => `${key}=${updates.get(key)}`));
   
-  envContent = envContent.replace(
-    'ADMIN_ADDRESS=your_admin_wallet_address_here',
-    `ADMIN_ADDRESS=${walletData.address}`
-  );
+  const envContent = lines.join('\n');
   
   // Write updated .env file
   fs.writeFileSync(envPath, envContent);